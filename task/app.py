@@ -3,16 +3,22 @@ Lyftr AI - Universal Website Scraper
 Main FastAPI application
 """
 
+import asyncio
 from urllib.parse import urlparse
 
+import orjson
 from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, JSONResponse, ORJSONResponse, Response
 from fastapi.templating import Jinja2Templates
 from pydantic import BaseModel, ValidationError
 
-from scraper import WebsiteScraper
+from cache import ScrapeCache
+from scraper import PLAYWRIGHT_AVAILABLE, WebsiteScraper, create_http_client
 
-app = FastAPI(title="Lyftr AI Website Scraper")
+if PLAYWRIGHT_AVAILABLE:
+    from playwright.async_api import async_playwright
+
+app = FastAPI(title="Lyftr AI Website Scraper", default_response_class=ORJSONResponse)
 templates = Jinja2Templates(directory="templates")
 
 
@@ -20,6 +26,53 @@ class ScrapeRequest(BaseModel):
     url: str
 
 
+@app.on_event("startup")
+async def startup():
+    """Create shared resources reused across scrapes"""
+    app.state.http = create_http_client()
+    app.state.cache = ScrapeCache()
+    
+    # Launch the browser once; each JS scrape opens its own context
+    app.state.playwright = None
+    app.state.browser = None
+    app.state.browser_lock = asyncio.Lock()
+    if PLAYWRIGHT_AVAILABLE:
+        try:
+            app.state.playwright = await async_playwright().start()
+            app.state.browser = await app.state.playwright.chromium.launch(headless=True)
+        except Exception:
+            # Browser not installed; scrapes will report the render error themselves
+            if app.state.playwright is not None:
+                await app.state.playwright.stop()
+                app.state.playwright = None
+
+
+@app.on_event("shutdown")
+async def shutdown():
+    """Release shared resources"""
+    await app.state.http.aclose()
+    if app.state.browser is not None:
+        await app.state.browser.close()
+    if app.state.playwright is not None:
+        await app.state.playwright.stop()
+
+
+async def _shared_browser():
+    """Return the shared browser, relaunching it if Chromium has gone away"""
+    if app.state.browser is None or app.state.browser.is_connected():
+        return app.state.browser
+    async with app.state.browser_lock:
+        # Another request may have relaunched it while we waited
+        if not app.state.browser.is_connected():
+            try:
+                app.state.browser = await app.state.playwright.chromium.launch(headless=True)
+            except Exception:
+                # Keep the dead browser so the next request retries; this one
+                # falls back to a one-off launch in the scraper
+                pass
+    return app.state.browser
+
+
 @app.get("/healthz")
 async def health_check():
     """Health check endpoint"""
@@ -44,10 +97,29 @@ async def scrape(request: ScrapeRequest):
                 detail="Only http and https URLs are supported"
             )
         
-        scraper = WebsiteScraper(request.url)
-        result = await scraper.scrape()
+        scraper = WebsiteScraper(
+            request.url,
+            client=app.state.http,
+            browser=await _shared_browser()
+        )
+        
+        # Reuse the previous result if the origin says the page is unchanged;
+        # if it changed, the page fetched while asking is scraped directly
+        static_html = None
+        cached = app.state.cache.get(request.url)
+        if cached:
+            static_html = await scraper.revalidate(cached.etag, cached.last_modified)
+            if scraper.not_modified:
+                return Response(content=cached.payload, media_type="application/json")
+        
+        result = await scraper.scrape(static_html=static_html)
+        
+        # Serialize once, for both the response and the cache
+        payload = orjson.dumps({"result": result})
+        if not result["errors"]:
+            app.state.cache.put(request.url, scraper.etag, scraper.last_modified, payload)
         
-        return {"result": result}
+        return Response(content=payload, media_type="application/json")
     
     except ValidationError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -0,0 +1,46 @@
+"""
+Scrape result cache
+In-process LRU of serialized /scrape responses, with the ETag / Last-Modified
+validators needed to revalidate them against the origin before reuse
+"""
+import time
+from collections import OrderedDict
+from typing import NamedTuple, Optional
+
+
+class CacheEntry(NamedTuple):
+    etag: Optional[str]
+    last_modified: Optional[str]
+    payload: bytes
+    expires_at: float
+
+
+class ScrapeCache:
+    """LRU cache of serialized scrape responses keyed by URL"""
+    
+    def __init__(self, max_entries: int = 512, ttl: float = 3600.0):
+        self.max_entries = max_entries
+        # Upper bound even when the origin keeps answering 304, since
+        # JS-rendered content can change while the HTML document does not
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+    
+    def get(self, url: str) -> Optional[CacheEntry]:
+        """Return the unexpired entry for url, if any"""
+        entry = self._entries.get(url)
+        if entry is None:
+            return None
+        if entry.expires_at < time.monotonic():
+            del self._entries[url]
+            return None
+        self._entries.move_to_end(url)
+        return entry
+    
+    def put(self, url: str, etag: Optional[str], last_modified: Optional[str], payload: bytes):
+        """Store a payload, evicting the least recently used entries"""
+        if not etag and not last_modified:
+            return  # Nothing to revalidate with
+        self._entries[url] = CacheEntry(etag, last_modified, payload, time.monotonic() + self.ttl)
+        self._entries.move_to_end(url)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
@@ -2,14 +2,18 @@
 Website Scraper - Core scraping logic
 Handles static scraping, JS rendering, interactions, and section extraction
 """
+import asyncio
+import os
 import re
 import time
+from sys import intern
 from datetime import datetime, timezone
+from itertools import chain, islice
 from typing import List, Dict, Any, Optional, Tuple
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urljoin, urlparse, urlsplit
 
-import requests
-from bs4 import BeautifulSoup
+import httpx
+from lxml import etree
 
 try:
     from playwright.async_api import async_playwright, Page, Browser, BrowserContext
@@ -22,12 +26,223 @@ except ImportError:
     BrowserContext = None
 
 
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+
+# Static fetches stop reading the body past this size
+_MAX_HTML_BYTES = 2_000_000
+
+# Limits concurrent parses running in worker threads
+_PARSE_SEMAPHORE = asyncio.Semaphore(os.cpu_count() or 1)
+
+_H1_RE = re.compile(r"<h1[\s>]", re.I)
+
+_NOISE_RE = re.compile(r"cookie|banner|modal|popup|overlay", re.I)
+
+# Section types as shared string objects, and the landmark tag -> type mapping
+_SECTION_TYPES = {t: intern(t) for t in ("nav", "footer", "section", "hero", "faq", "pricing", "unknown")}
+_TAG_SECTION_TYPES = {
+    "header": _SECTION_TYPES["nav"],
+    "nav": _SECTION_TYPES["nav"],
+    "footer": _SECTION_TYPES["footer"],
+    "section": _SECTION_TYPES["section"],
+    "article": _SECTION_TYPES["section"],
+    "main": _SECTION_TYPES["section"],
+}
+# Class keyword -> type, in order of precedence
+_CLASS_SECTION_TYPES = (
+    ("hero", _SECTION_TYPES["hero"]),
+    ("faq", _SECTION_TYPES["faq"]),
+    ("pricing", _SECTION_TYPES["pricing"]),
+)
+
+_LANDMARK_TAGS = ("header", "nav", "main", "section", "footer", "article")
+_FALLBACK_HEADING_TAGS = ("h1", "h2", "h3")
+_HEADING_TAGS = frozenset(("h1", "h2", "h3", "h4", "h5", "h6"))
+# Tags whose contents are not readable page text
+_NON_TEXT_TAGS = frozenset(("script", "style", "template", "rt", "rp"))
+
+# Per-section content limits
+_MAX_HEADINGS = 10
+_MAX_PARAGRAPHS = 10
+_MAX_LINKS = 50
+_MAX_IMAGES = 20
+_MAX_LISTS = 10
+_MAX_TABLES = 5
+_MAX_RAW_HTML = 5000
+_MAX_FALLBACK_BLOCKS = 50  # div/span elements examined when paragraphs are sparse
+
+# Scroll to the bottom, let content load, then report [height, height 1s later]
+_SCROLL_AND_MEASURE_JS = """async () => {
+    const sleep = ms => new Promise(r => setTimeout(r, ms));
+    window.scrollTo(0, document.body.scrollHeight);
+    await sleep(2000);
+    const before = document.body.scrollHeight;
+    await sleep(1000);
+    return [before, document.body.scrollHeight];
+}"""
+
+# Click the first visible tab; returns whether one was clicked. Returns
+# right after the click, since a tab that is a link may navigate away
+_CLICK_TAB_JS = """() => {
+    const tab = [...document.querySelectorAll('[role="tab"], .tab, [class*="tab"]')]
+        .find(el => el.getClientRects().length > 0);
+    if (!tab) {
+        return false;
+    }
+    tab.click();
+    return true;
+}"""
+
+# Click the first visible "Load more"/"Show more" control; returns the
+# selector label of what was clicked, or null
+_CLICK_LOAD_MORE_JS = """() => {
+    const visible = el => el.getClientRects().length > 0;
+    const textOf = el => (el.textContent || "").replace(/\\s+/g, " ").toLowerCase();
+    const candidates = [
+        ['button:has-text("Load more")', "button", "load more"],
+        ['button:has-text("Show more")', "button", "show more"],
+        ['a:has-text("Load more")', "a", "load more"],
+        ['[class*="load-more"]', '[class*="load-more"]', null],
+        ['[class*="show-more"]', '[class*="show-more"]', null],
+    ];
+    for (const [label, css, text] of candidates) {
+        const el = [...document.querySelectorAll(css)].find(
+            e => visible(e) && (!text || textOf(e).includes(text))
+        );
+        if (el) {
+            el.click();
+            return label;
+        }
+    }
+    return null;
+}"""
+
+# Scroll to the bottom n times, pausing between scrolls; returns the final height
+_SCROLL_N_TIMES_JS = """async (n) => {
+    for (let i = 0; i < n; i++) {
+        window.scrollTo(0, document.body.scrollHeight);
+        await new Promise(r => setTimeout(r, 1500));
+    }
+    return document.body.scrollHeight;
+}"""
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """Create the shared HTTP client used for static fetches"""
+    return httpx.AsyncClient(
+        http2=True,
+        timeout=10.0,
+        follow_redirects=True,
+        headers={"User-Agent": USER_AGENT},
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=100)
+    )
+
+
+def _parse_html(html: str) -> Tuple[Optional[etree._Element], Optional[str]]:
+    """Parse an HTML document, returning its root element (None if empty)
+    and the fatal error that cut parsing short, if any"""
+    # The text is already decoded; re-encode so any <meta charset> is ignored.
+    # huge_tree lifts libxml2's nesting depth limit (256), past which it
+    # would drop the rest of the document. Parsers are not thread-safe.
+    parser = etree.HTMLParser(encoding="utf-8", huge_tree=True)
+    tree = etree.fromstring(html.encode("utf-8", errors="replace"), parser)
+    if tree is not None:
+        # <template> content is inert markup, not page content
+        etree.strip_elements(tree, "template", with_tail=False)
+    fatal = next(
+        (e.message for e in parser.error_log if e.level == etree.ErrorLevels.FATAL),
+        None
+    )
+    return tree, fatal
+
+
+def _text(element: etree._Element) -> str:
+    """Text of element and its descendants, each piece stripped, concatenated"""
+    parts = []
+    # Iterative walk (deep DOMs would exceed the recursion limit). The stack
+    # holds elements still to visit and tail strings still to emit.
+    stack = [element]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            text = item.strip()
+        else:
+            # Push in reverse so the first child (then its tail) comes off first
+            for child in reversed(item):
+                if child.tail:
+                    stack.append(child.tail)
+                # Comments and processing instructions have a non-str tag
+                if isinstance(child.tag, str) and child.tag not in _NON_TEXT_TAGS:
+                    stack.append(child)
+            text = item.text.strip() if item.text else ""
+        if text:
+            parts.append(text)
+    return "".join(parts)
+
+
+def _is_noise(element: etree._Element) -> bool:
+    """Check an element's own class/id for cookie banners, modals and popups"""
+    return bool(_NOISE_RE.search(f"{element.get('class') or ''} {element.get('id') or ''}"))
+
+
+def _absolute_url(href: str, source_url: str, scheme: str) -> str:
+    """urljoin with fast paths for absolute and protocol-relative URLs"""
+    if href.startswith(("http://", "https://")):
+        return href
+    if href.startswith("//"):
+        return f"{scheme}:{href}"
+    return urljoin(source_url, href)
+
+
+def _truncated_html(element: etree._Element, limit: int) -> Tuple[str, bool]:
+    """Serialise element (without its tail), cut to `limit` chars"""
+    raw_html = etree.tostring(element, encoding="unicode", method="html", with_tail=False)
+    if len(raw_html) > limit:
+        return raw_html[:limit] + "...", True
+    return raw_html, False
+
+
+def _list_items(list_element: etree._Element) -> List[str]:
+    """Non-empty item texts of a <ul>/<ol>"""
+    items = []
+    for li in list_element.iterdescendants("li"):
+        item_text = _text(li)
+        if item_text:
+            items.append(item_text)
+    return items
+
+
+def _table_rows(table: etree._Element) -> List[List[str]]:
+    """Cell texts of a <table>, one list per non-empty row"""
+    table_data = []
+    for tr in table.iterdescendants("tr"):
+        row = []
+        for td in tr.iterdescendants("td", "th"):
+            cell_text = _text(td)
+            row.append(cell_text)
+        if row:
+            table_data.append(row)
+    return table_data
+
+
 class WebsiteScraper:
     """Main scraper class"""
     
-    def __init__(self, url: str):
+    def __init__(
+        self,
+        url: str,
+        client: Optional[httpx.AsyncClient] = None,
+        browser: Optional[Browser] = None
+    ):
         self.url = url
+        self.client = client
+        self.browser = browser
         self.base_url = url
+        # Validators from the static fetch, used for response caching
+        self.etag = None
+        self.last_modified = None
+        # Set when a conditional fetch (revalidate) gets 304 Not Modified
+        self.not_modified = False
         self.visited_urls = set()
         self.sections = []
         self.interactions = {
@@ -43,55 +258,51 @@ class WebsiteScraper:
             "canonical": None
         }
     
-    async def scrape(self) -> Dict[str, Any]:
-        """Main scraping method"""
+    async def scrape(self, static_html: Optional[str] = None) -> Dict[str, Any]:
+        """Main scraping method; static_html skips the static fetch when the
+        page has already been fetched (e.g. by revalidate())"""
         scraped_at = datetime.now(timezone.utc).isoformat()
         
         # Try static scraping first
-        static_html = self._static_fetch()
+        if static_html is None:
+            static_html = await self._static_fetch()
+        
+        # Static HTML without any <h1> is usually a client-rendered shell:
+        # start rendering right away, overlapping it with static parsing
+        js_task = None
+        if static_html is None or not _H1_RE.search(static_html):
+            js_task = self._start_js_scrape()
         
         sections = []
         if static_html:
             # Parse static HTML
-            parser = BeautifulSoup(static_html, 'html.parser')
-            self._extract_meta(parser)
-            sections = self._extract_sections(parser, self.url)
+            sections = await self._parse_and_extract(static_html)
             
             # Heuristic: if we got very little content, try JS rendering
             total_text = sum(len(s.get("content", {}).get("text", "")) for s in sections)
             if total_text < 500:  # Less than 500 chars, likely needs JS
-                try:
-                    js_result = await self._js_scrape()
-                    if js_result and js_result["sections"]:
-                        sections = js_result["sections"]
-                        self.interactions = js_result["interactions"]
-                        self.errors.extend(js_result.get("errors", []))
-                except Exception as e:
-                    self.errors.append({
-                        "message": f"JS scraping failed: {str(e)}",
-                        "phase": "render"
-                    })
-                    # Keep static sections if JS fails
-        else:
-            # Static fetch failed, try JS
-            try:
-                js_result = await self._js_scrape()
-                if js_result:
+                js_result = await self._finish_js_scrape(js_task or self._start_js_scrape())
+                if js_result and js_result["sections"]:
                     sections = js_result["sections"]
                     self.interactions = js_result["interactions"]
                     self.errors.extend(js_result.get("errors", []))
-            except Exception as e:
-                self.errors.append({
-                    "message": f"JS scraping failed: {str(e)}",
-                    "phase": "render"
-                })
-                sections = []
+                # Otherwise keep static sections
+            elif js_task:
+                # Static content was enough after all
+                await self._cancel_js_scrape(js_task)
+        else:
+            # Static fetch failed, use JS
+            js_result = await self._finish_js_scrape(js_task)
+            if js_result:
+                sections = js_result["sections"]
+                self.interactions = js_result["interactions"]
+                self.errors.extend(js_result.get("errors", []))
         
         # Ensure we have at least one section
         if not sections:
             sections = [{
                 "id": "empty-0",
-                "type": "unknown",
+                "type": _SECTION_TYPES["unknown"],
                 "label": "No content found",
                 "sourceUrl": self.url,
                 "content": {
@@ -115,15 +326,24 @@ class WebsiteScraper:
             "errors": self.errors
         }
     
-    def _static_fetch(self) -> Optional[str]:
+    async def revalidate(self, etag: Optional[str], last_modified: Optional[str]) -> Optional[str]:
+        """Conditional fetch for a cached result. Sets not_modified on a 304;
+        otherwise returns the page HTML for scrape() to reuse (None if the
+        fetch failed, in which case scrape() fetches and reports as usual)"""
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        try:
+            return await self._fetch_html(headers)
+        except Exception:
+            return None
+    
+    async def _static_fetch(self) -> Optional[str]:
         """Fetch static HTML"""
         try:
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-            }
-            response = requests.get(self.url, headers=headers, timeout=10)
-            response.raise_for_status()
-            return response.text
+            return await self._fetch_html()
         except Exception as e:
             self.errors.append({
                 "message": f"Static fetch failed: {str(e)}",
@@ -131,38 +351,81 @@ class WebsiteScraper:
             })
             return None
     
-    def _extract_meta(self, parser: BeautifulSoup):
+    async def _fetch_html(self, headers: Optional[Dict[str, str]] = None) -> Optional[str]:
+        if self.client is not None:
+            return await self._stream_html(self.client, headers)
+        
+        # No shared client (e.g. used outside the app), use a one-off one
+        async with create_http_client() as client:
+            return await self._stream_html(client, headers)
+    
+    async def _stream_html(self, client: httpx.AsyncClient, headers: Optional[Dict[str, str]] = None) -> Optional[str]:
+        """Stream the page body, giving up after _MAX_HTML_BYTES"""
+        async with client.stream("GET", self.url, headers=headers) as response:
+            if response.status_code == 304:
+                self.not_modified = True
+                return None
+            response.raise_for_status()
+            self.etag = response.headers.get("etag")
+            self.last_modified = response.headers.get("last-modified")
+            body = bytearray()
+            async for chunk in response.aiter_bytes():
+                body.extend(chunk)
+                if len(body) >= _MAX_HTML_BYTES:
+                    break
+            return body[:_MAX_HTML_BYTES].decode(response.encoding or "utf-8", errors="replace")
+    
+    async def _parse_and_extract(self, html: str) -> List[Dict[str, Any]]:
+        """Parse HTML and extract meta and sections in a worker thread, so
+        the CPU-bound work does not hold up the event loop"""
+        async with _PARSE_SEMAPHORE:
+            return await asyncio.to_thread(self._parse_and_extract_sync, html)
+    
+    def _parse_and_extract_sync(self, html: str) -> List[Dict[str, Any]]:
+        tree, fatal = _parse_html(html)
+        if fatal:
+            self.errors.append({
+                "message": f"HTML parsing stopped early: {fatal}",
+                "phase": "parse"
+            })
+        if tree is None:
+            return []
+        self._extract_meta(tree)
+        return self._extract_sections(tree, self.url)
+    
+    def _extract_meta(self, tree: etree._Element):
         """Extract meta information"""
         # Title
-        title_elem = parser.select_one("title")
-        if not title_elem:
-            og_title = parser.select_one('meta[property="og:title"]')
-            if og_title:
+        title_elem = tree.find(".//title")
+        if title_elem is None:
+            og_title = tree.find(".//meta[@property='og:title']")
+            if og_title is not None:
                 self.meta["title"] = og_title.get("content", "")
         else:
-            self.meta["title"] = title_elem.get_text(strip=True)
+            self.meta["title"] = _text(title_elem)
         
         # Description
-        desc_elem = parser.select_one('meta[name="description"]')
-        if not desc_elem:
-            og_desc = parser.select_one('meta[property="og:description"]')
-            if og_desc:
+        desc_elem = tree.find(".//meta[@name='description']")
+        if desc_elem is None:
+            og_desc = tree.find(".//meta[@property='og:description']")
+            if og_desc is not None:
                 self.meta["description"] = og_desc.get("content", "")
         else:
             self.meta["description"] = desc_elem.get("content", "")
         
         # Language
-        html_elem = parser.select_one("html")
-        if html_elem:
+        html_elem = tree if tree.tag == "html" else tree.find(".//html")
+        if html_elem is not None:
             lang = html_elem.get("lang", "en")
             self.meta["language"] = lang[:2] if lang else "en"
         
-        # Canonical
-        canonical_elem = parser.select_one('link[rel="canonical"]')
-        if canonical_elem:
-            self.meta["canonical"] = canonical_elem.get("href")
+        # Canonical (rel is a space-separated list)
+        for link in tree.iter("link"):
+            if "canonical" in (link.get("rel") or "").split():
+                self.meta["canonical"] = link.get("href")
+                break
     
-    def _extract_sections(self, parser: BeautifulSoup, source_url: str) -> List[Dict[str, Any]]:
+    def _extract_sections(self, tree: etree._Element, source_url: str) -> List[Dict[str, Any]]:
         """Extract sections from HTML"""
         sections = []
         section_id_counter = 0
@@ -176,18 +439,18 @@ class WebsiteScraper:
         ]
         
         # Find landmark elements
-        landmarks = parser.select("header, nav, main, section, footer, article")
+        landmarks = list(tree.iter(*_LANDMARK_TAGS))
         
         if not landmarks:
             # Fallback: use headings to create sections
-            headings = parser.select("h1, h2, h3")
+            headings = tree.iter(*_FALLBACK_HEADING_TAGS)
             for heading in headings:
                 # Skip if in noise
-                parent = heading.parent
-                if parent and any(noise in str(parent).lower() for noise in ["cookie", "banner", "modal"]):
+                parent = heading.getparent()
+                if parent is not None and _is_noise(parent):
                     continue
                 
-                if parent:
+                if parent is not None:
                     section = self._extract_section_from_element(parent, source_url, section_id_counter)
                     if section:
                         sections.append(section)
@@ -195,7 +458,7 @@ class WebsiteScraper:
         else:
             for landmark in landmarks:
                 # Skip noise elements
-                if any(noise in str(landmark).lower() for noise in ["cookie", "banner", "modal", "popup"]):
+                if _is_noise(landmark):
                     continue
                 
                 section = self._extract_section_from_element(landmark, source_url, section_id_counter)
@@ -205,8 +468,8 @@ class WebsiteScraper:
         
         # If still no sections, create one from body
         if not sections:
-            body = parser.select_one("body")
-            if body:
+            body = tree.find(".//body")
+            if body is not None:
                 section = self._extract_section_from_element(body, source_url, section_id_counter)
                 if section:
                     sections.append(section)
@@ -215,103 +478,117 @@ class WebsiteScraper:
     
     def _extract_section_from_element(self, element, source_url: str, section_id: int) -> Optional[Dict[str, Any]]:
         """Extract section data from a DOM element"""
-        if not element:
+        if element is None:
             return None
         
         # Determine type
-        tag_name = element.name.lower() if element.name else "unknown"
-        section_type = "unknown"
-        if tag_name == "header":
-            section_type = "nav"
-        elif tag_name == "nav":
-            section_type = "nav"
-        elif tag_name == "footer":
-            section_type = "footer"
-        elif tag_name in ("section", "article", "main"):
-            section_type = "section"
+        tag_name = element.tag if isinstance(element.tag, str) else "unknown"
+        section_type = _TAG_SECTION_TYPES.get(tag_name, _SECTION_TYPES["unknown"])
         
-        # Check class attribute
-        class_attr = element.get("class", [])
-        class_str = " ".join(class_attr) if isinstance(class_attr, list) else str(class_attr)
-        if "hero" in class_str.lower():
-            section_type = "hero"
-        elif "faq" in class_str.lower():
-            section_type = "faq"
-        elif "pricing" in class_str.lower():
-            section_type = "pricing"
+        # Check class tokens directly; an earlier keyword in
+        # _CLASS_SECTION_TYPES wins regardless of token order
+        class_rank = len(_CLASS_SECTION_TYPES)
+        for cls in (element.get("class") or "").split():
+            cls = cls.lower()
+            for rank in range(class_rank):
+                if _CLASS_SECTION_TYPES[rank][0] in cls:
+                    class_rank = rank
+                    break
+            if class_rank == 0:
+                break
+        if class_rank < len(_CLASS_SECTION_TYPES):
+            section_type = _CLASS_SECTION_TYPES[class_rank][1]
         
-        # Extract headings
-        headings = []
-        for h in element.select("h1, h2, h3, h4, h5, h6"):
-            text = h.get_text(strip=True)
-            if text:
-                headings.append(text)
+        scheme = urlsplit(source_url).scheme
         
-        # Extract text
+        # Walk the subtree once, dispatching on tag name and stopping as
+        # soon as every per-section limit has been reached
+        headings = []
         text_parts = []
-        for p in element.select("p"):
-            text = p.get_text(strip=True)
-            if text and len(text) > 10:  # Filter very short text
-                text_parts.append(text)
-        
-        # Also get text from divs and spans if paragraphs are sparse
-        if len(text_parts) < 2:
-            for div in element.select("div, span"):
-                text = div.get_text(strip=True)
-                if text and len(text) > 20 and text not in text_parts:
-                    text_parts.append(text)
-        
-        text_content = " ".join(text_parts[:10])  # Limit to first 10 paragraphs
-        
-        # Extract links
         links = []
-        for a in element.select("a"):
-            href = a.get("href")
-            if href:
-                absolute_url = urljoin(source_url, href)
-                link_text = a.get_text(strip=True)
-                if link_text:
-                    links.append({
-                        "text": link_text[:100],  # Truncate long link text
-                        "href": absolute_url
-                    })
-        
-        # Extract images
         images = []
-        for img in element.select("img"):
-            src = img.get("src") or img.get("data-src")
-            if src:
-                absolute_src = urljoin(source_url, src)
-                alt = img.get("alt", "")
-                images.append({
-                    "src": absolute_src,
-                    "alt": alt
-                })
-        
-        # Extract lists
         lists = []
-        for ul_ol in element.select("ul, ol"):
-            items = []
-            for li in ul_ol.select("li"):
-                item_text = li.get_text(strip=True)
-                if item_text:
-                    items.append(item_text)
-            if items:
-                lists.append(items)
-        
-        # Extract tables (simplified)
         tables = []
-        for table in element.select("table"):
-            table_data = []
-            for tr in table.select("tr"):
-                row = []
-                for td in tr.select("td, th"):
-                    cell_text = td.get_text(strip=True)
-                    row.append(cell_text)
-                if row:
-                    table_data.append(row)
-            if table_data:
-                tables.append(table_data)
+        for node in element.iterdescendants():
+            name = node.tag
+            if not isinstance(name, str):
+                continue  # Comments, processing instructions
+            
+            if name in _HEADING_TAGS:
+                if len(headings) < _MAX_HEADINGS:
+                    text = _text(node)
+                    if text:
+                        headings.append(text)
+            
+            elif name == "p":
+                if len(text_parts) < _MAX_PARAGRAPHS:
+                    text = _text(node)
+                    if text and len(text) > 10:  # Filter very short text
+                        text_parts.append(text)
+            
+            elif name == "a":
+                if len(links) < _MAX_LINKS:
+                    href = node.get("href")
+                    link_text = _text(node) if href else ""
+                    if link_text:
+                        links.append({
+                            "text": link_text[:100],  # Truncate long link text
+                            "href": _absolute_url(href, source_url, scheme)
+                        })
+            
+            elif name == "img":
+                if len(images) < _MAX_IMAGES:
+                    src = node.get("src") or node.get("data-src")
+                    if src:
+                        images.append({
+                            "src": _absolute_url(src, source_url, scheme),
+                            "alt": node.get("alt", "")
+                        })
+            
+            elif name in ("ul", "ol"):
+                if len(lists) < _MAX_LISTS:
+                    items = _list_items(node)
+                    if items:
+                        lists.append(items)
+            
+            elif name == "table":
+                if len(tables) < _MAX_TABLES:
+                    table_data = _table_rows(node)
+                    if table_data:
+                        tables.append(table_data)
+            
+            else:
+                continue
+            
+            if (len(headings) >= _MAX_HEADINGS and len(text_parts) >= _MAX_PARAGRAPHS
+                    and len(links) >= _MAX_LINKS and len(images) >= _MAX_IMAGES
+                    and len(lists) >= _MAX_LISTS and len(tables) >= _MAX_TABLES):
+                break
+        
+        # Also get text from divs and spans if paragraphs are sparse: direct
+        # children first, descending into the subtree only if they give nothing
+        if len(text_parts) < 2:
+            seen = set(text_parts)
+            for recursive in (False, True):
+                found = False
+                if recursive:
+                    # The direct children were already tried, start below them
+                    blocks = chain.from_iterable(child.iterdescendants("div", "span") for child in element)
+                else:
+                    blocks = element.iterchildren("div", "span")
+                for div in islice(blocks, _MAX_FALLBACK_BLOCKS):
+                    text = _text(div)
+                    if len(text) <= 20 or text in seen:
+                        continue
+                    seen.add(text)
+                    text_parts.append(text)
+                    found = True
+                    if len(text_parts) >= _MAX_PARAGRAPHS:
+                        break
+                if found:
+                    break
+        
+        text_content = " ".join(text_parts[:_MAX_PARAGRAPHS])
         
         # Generate label
         label = "Section"
@@ -322,11 +599,7 @@ class WebsiteScraper:
             label = " ".join(words)
         
         # Get raw HTML
-        raw_html = str(element)
-        truncated = False
-        if len(raw_html) > 5000:
-            raw_html = raw_html[:5000] + "..."
-            truncated = True
+        raw_html, truncated = _truncated_html(element, _MAX_RAW_HTML)
         
         return {
             "id": f"{section_type}-{section_id}",
@@ -334,17 +607,53 @@ class WebsiteScraper:
             "label": label[:100],
             "sourceUrl": source_url,
             "content": {
-                "headings": headings[:10],
+                "headings": headings,
                 "text": text_content[:5000],  # Limit text length
-                "links": links[:50],  # Limit links
-                "images": images[:20],  # Limit images
-                "lists": lists[:10],
-                "tables": tables[:5]
+                "links": links,
+                "images": images,
+                "lists": lists,
+                "tables": tables
             },
             "rawHtml": raw_html,
             "truncated": truncated
         }
     
+    def _start_js_scrape(self) -> asyncio.Task:
+        """Start a JS scrape in the background on a separate scraper, so a
+        render that ends up unused leaves this scraper's state untouched"""
+        renderer = WebsiteScraper(self.url, client=self.client, browser=self.browser)
+        return asyncio.create_task(renderer._render())
+    
+    async def _render(self) -> Tuple["WebsiteScraper", Optional[Dict[str, Any]]]:
+        """Run _js_scrape, recording a failure as an error instead of raising"""
+        try:
+            result = await self._js_scrape()
+        except Exception as e:
+            self.errors.append({
+                "message": f"JS scraping failed: {str(e)}",
+                "phase": "render"
+            })
+            result = None
+        return self, result
+    
+    async def _finish_js_scrape(self, js_task: asyncio.Task) -> Optional[Dict[str, Any]]:
+        """Wait for a background JS scrape and merge its meta and errors"""
+        renderer, result = await js_task
+        self.errors.extend(renderer.errors)
+        if result:
+            # Rendered meta wins over static meta where it found a value
+            self.meta.update({k: v for k, v in renderer.meta.items() if v})
+        return result
+    
+    @staticmethod
+    async def _cancel_js_scrape(js_task: asyncio.Task):
+        """Abandon a background JS scrape, letting it close its browser context"""
+        js_task.cancel()
+        try:
+            await js_task
+        except asyncio.CancelledError:
+            pass
+    
     async def _js_scrape(self) -> Optional[Dict[str, Any]]:
         """Scrape using Playwright for JS-rendered content"""
         if not PLAYWRIGHT_AVAILABLE:
@@ -354,82 +663,89 @@ class WebsiteScraper:
             })
             return None
         
+        if self.browser is not None and self.browser.is_connected():
+            return await self._js_scrape_with_browser(self.browser)
+        
+        # No usable shared browser (used outside the app, or Chromium
+        # crashed), launch a one-off one
         async with async_playwright() as p:
             browser = await p.chromium.launch(headless=True)
-            context = await browser.new_context(
-                viewport={"width": 1920, "height": 1080},
-                user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-            )
-            page = await context.new_page()
-            
             try:
-                # Navigate to URL
-                await page.goto(self.url, wait_until="networkidle", timeout=30000)
-                self.visited_urls.add(self.url)
-                self.interactions["pages"].append(self.url)
-                
-                # Wait for content to load
-                await page.wait_for_timeout(2000)  # Wait 2 seconds for JS to render
-                
-                # Try to click tabs or "Load more" buttons
-                await self._handle_interactions(page)
-                
-                # Handle scroll/pagination
-                await self._handle_scroll_and_pagination(page)
-                
-                # Get final HTML
-                html = await page.content()
-                
-                # Extract sections
-                parser = BeautifulSoup(html, 'lxml')
-                self._extract_meta(parser)
-                sections = self._extract_sections(parser, self.url)
-                
+                return await self._js_scrape_with_browser(browser)
+            finally:
                 await browser.close()
-                
-                return {
-                    "sections": sections,
-                    "interactions": self.interactions,
-                    "errors": []
-                }
+    
+    async def _js_scrape_with_browser(self, browser: Browser) -> Dict[str, Any]:
+        """Render the page in a fresh context of an already running browser"""
+        # Shielded so a cancel during creation still gets a handle to close:
+        # Chromium creates the context once the request has been sent
+        context_task = asyncio.ensure_future(browser.new_context(
+            viewport={"width": 1920, "height": 1080},
+            user_agent=USER_AGENT
+        ))
+        try:
+            context = await asyncio.shield(context_task)
+        except asyncio.CancelledError:
+            try:
+                await (await context_task).close()
+            except Exception:
+                pass
+            raise
+        
+        try:
+            page = await context.new_page()
             
-            except Exception as e:
-                await browser.close()
-                raise e
+            # Navigate to URL
+            await page.goto(self.url, wait_until="networkidle", timeout=30000)
+            self.visited_urls.add(self.url)
+            self.interactions["pages"].append(self.url)
+            
+            # Wait for content to load
+            await page.wait_for_timeout(2000)  # Wait 2 seconds for JS to render
+            
+            # Try to click tabs or "Load more" buttons
+            await self._handle_interactions(page)
+            
+            # Handle scroll/pagination
+            await self._handle_scroll_and_pagination(page)
+            
+            # Get final HTML
+            html = await page.content()
+            
+            # Extract sections
+            sections = await self._parse_and_extract(html)
+            
+            return {
+                "sections": sections,
+                "interactions": self.interactions,
+                "errors": []
+            }
+        
+        finally:
+            # Only the context is per-scrape; the browser is shared
+            await context.close()
     
     async def _handle_interactions(self, page: Page):
         """Handle click interactions (tabs, load more buttons)"""
         try:
-            # Try to find and click tabs
-            tabs = await page.query_selector_all('[role="tab"], .tab, [class*="tab"]')
-            if tabs and len(tabs) > 0:
-                # Click first tab if not already active
-                try:
-                    await tabs[0].click(timeout=5000)
-                    self.interactions["clicks"].append('[role="tab"] or .tab')
-                    await page.wait_for_timeout(1000)
-                except:
-                    pass
-            
-            # Try to find "Load more" or "Show more" buttons
-            load_more_selectors = [
-                'button:has-text("Load more")',
-                'button:has-text("Show more")',
-                'a:has-text("Load more")',
-                '[class*="load-more"]',
-                '[class*="show-more"]'
-            ]
+            # Find and click the first visible tab (one round-trip)
+            try:
+                tab_clicked = await page.evaluate(_CLICK_TAB_JS)
+            except Exception as e:
+                # A tab that is a link navigates away, destroying the context
+                # the evaluate ran in; the click itself still happened
+                if "Execution context was destroyed" not in str(e):
+                    raise
+                tab_clicked = True
+            if tab_clicked:
+                self.interactions["clicks"].append('[role="tab"] or .tab')
+                await page.wait_for_timeout(1000)
             
-            for selector in load_more_selectors:
-                try:
-                    button = await page.query_selector(selector)
-                    if button:
-                        await button.click(timeout=5000)
-                        self.interactions["clicks"].append(selector)
-                        await page.wait_for_timeout(2000)  # Wait for content to load
-                        break
-                except:
-                    continue
+            # Then the first visible "Load more"/"Show more" control
+            load_more = await page.evaluate(_CLICK_LOAD_MORE_JS)
+            if load_more:
+                self.interactions["clicks"].append(load_more)
+                await page.wait_for_timeout(2000)  # Wait for content to load
         
         except Exception as e:
             self.errors.append({
@@ -445,15 +761,9 @@ class WebsiteScraper:
             
             # First, try infinite scroll
             for i in range(3):
-                # Scroll down
-                await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+                # Scroll down and check if new content loaded, in one round-trip
+                current_height, new_height = await page.evaluate(_SCROLL_AND_MEASURE_JS)
                 self.interactions["scrolls"] += 1
-                await page.wait_for_timeout(2000)  # Wait for content to load
-                
-                # Check if new content loaded
-                current_height = await page.evaluate("document.body.scrollHeight")
-                await page.wait_for_timeout(1000)
-                new_height = await page.evaluate("document.body.scrollHeight")
                 
                 # If no new content, try pagination
                 if current_height == new_height and i == 0:
@@ -484,10 +794,9 @@ class WebsiteScraper:
             # Ensure we have at least 3 pages or 3 scrolls
             if len(self.interactions["pages"]) < 3 and self.interactions["scrolls"] < 3:
                 # Do more scrolling
-                for _ in range(3 - self.interactions["scrolls"]):
-                    await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                    self.interactions["scrolls"] += 1
-                    await page.wait_for_timeout(1500)
+                remaining = 3 - self.interactions["scrolls"]
+                await page.evaluate(_SCROLL_N_TIMES_JS, remaining)
+                self.interactions["scrolls"] += remaining
         
         except Exception as e:
             self.errors.append({